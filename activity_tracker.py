@@ -13,47 +13,192 @@ Usage:
     activity-tracker --help             # Show help
 """
 
-import argparse
 import sys
+import time
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, List, Tuple
 
+# requests is slow to import, so it is only loaded once a tracker is created
+# and --help or a bad argument exits without paying for it
+requests = None
+
 try:
-    import requests
+    # Faster JSON parsing for large event payloads, if available
+    import orjson
 except ImportError:
-    print("Error: 'requests' module not found.")
-    print("Please install it with: pip install requests")
-    sys.exit(1)
+    import json as orjson
+
+# How long a fetched bucket list is reused before asking aw-server again
+BUCKETS_TTL_SECONDS = 60
+
+# ActivityWatch names AFK buckets "aw-watcher-afk_<hostname>"
+AFK_BUCKET_PREFIX = "aw-watcher-afk"
 
 
 class ActivityWatchTracker:
     def __init__(self, host: str = "localhost", port: int = 5600):
+        global requests
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+        except ImportError:
+            print("Error: 'requests' module not found.")
+            print("Please install it with: pip install requests")
+            sys.exit(1)
+
         self.base_url = f"http://{host}:{port}"
         self.api_url = f"{self.base_url}/api/0"
 
+        # Reuse one keep-alive connection for all calls to the same aw-server
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        # Retry transient server errors with backoff; the /query POST is
+        # read-only, so it is safe to retry as well. Connection errors and
+        # read timeouts fail at once so a down or slow aw-server isn't retried
+        retry = Retry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16)
+        self.session.mount(self.base_url, adapter)
+        # (connect, read) timeouts so a hung aw-server can't stall the tracker
+        self.timeout = (1.0, 5.0)
+
+        # The bucket list is effectively static, so cache it briefly
+        self._buckets_cache = None
+        self._buckets_cache_at = 0.0
+        self._afk_buckets = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def ping(self):
+        """Check that the ActivityWatch server is reachable."""
+        response = self.session.get(f"{self.api_url}/info", timeout=self.timeout)
+        response.raise_for_status()
+
+    def invalidate_buckets(self):
+        """Drop the cached bucket list so the next lookup refetches it."""
+        self._buckets_cache = None
+        self._buckets_cache_at = 0.0
+        self._afk_buckets = None
+
     def get_buckets(self) -> Dict:
-        """Fetch all available buckets from ActivityWatch."""
+        """
+        Fetch all available buckets from ActivityWatch.
+
+        Results are cached for BUCKETS_TTL_SECONDS.
+        """
+        if (
+            self._buckets_cache is not None
+            and time.monotonic() - self._buckets_cache_at < BUCKETS_TTL_SECONDS
+        ):
+            return self._buckets_cache
+
         try:
-            response = requests.get(f"{self.api_url}/buckets")
+            response = self.session.get(f"{self.api_url}/buckets", timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            buckets = orjson.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching buckets: {e}")
+            # Don't keep serving AFK buckets from a list we failed to refresh
+            self.invalidate_buckets()
             return {}
 
+        self._buckets_cache = buckets
+        self._buckets_cache_at = time.monotonic()
+        self._afk_buckets = None
+        return buckets
+
+    def get_afk_buckets(self, buckets: Dict) -> List[str]:
+        """
+        Return the ids of the AFK (Away From Keyboard) buckets in buckets.
+
+        The result is cached while buckets is the cached bucket list.
+        """
+        if buckets is not self._buckets_cache:
+            return [bid for bid in buckets if bid.startswith(AFK_BUCKET_PREFIX)]
+
+        if self._afk_buckets is None:
+            self._afk_buckets = [
+                bid for bid in buckets if bid.startswith(AFK_BUCKET_PREFIX)
+            ]
+        return self._afk_buckets
+
     def get_events(self, bucket_id: str, start_time: str, end_time: str) -> List:
         """Fetch events from a specific bucket for the given time range."""
         try:
             params = {"start": start_time, "end": end_time}
-            response = requests.get(
-                f"{self.api_url}/buckets/{bucket_id}/events", params=params
+            response = self.session.get(
+                f"{self.api_url}/buckets/{bucket_id}/events",
+                params=params,
+                timeout=self.timeout,
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching events from bucket {bucket_id}: {e}")
             return []
 
+    def query_week(
+        self, week_start: datetime, afk_bucket_id: str, days: int = 7
+    ) -> List[Tuple[float, float]]:
+        """
+        Sum active and idle time per day for a week with a single /query call.
+
+        The aggregation runs server-side in aw-server, so only the per-day
+        totals are transferred. The raw events are summed without flood(), so
+        the totals match calculate_daily_time. Only the first `days` days of
+        the week are queried.
+
+        Returns:
+            List[Tuple[float, float]]: (active_seconds, idle_seconds) for each
+            queried day, or an empty list if the query failed
+        """
+        timeperiods = [
+            f"{(week_start + timedelta(days=i)).isoformat()}/"
+            f"{(week_start + timedelta(days=i + 1)).isoformat()}"
+            for i in range(days)
+        ]
+        query = [
+            f'afk = query_bucket("{afk_bucket_id}");',
+            'active = filter_keyvals(afk, "status", ["not-afk"]);',
+            'idle = filter_keyvals(afk, "status", ["afk"]);',
+            "RETURN = [sum_durations(active), sum_durations(idle)];",
+        ]
+        try:
+            response = self.session.post(
+                f"{self.api_url}/query",
+                json={"timeperiods": timeperiods, "query": query},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return [(active, idle) for active, idle in orjson.loads(response.content)]
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error querying bucket {afk_bucket_id}: {e}")
+            return []
+
+    def fetch_week_events(
+        self, afk_bucket_id: str, week_start: datetime, week_end: datetime
+    ) -> List:
+        """Fetch all events from a bucket for a week in a single request."""
+        return self.get_events(
+            afk_bucket_id, week_start.isoformat(), week_end.isoformat()
+        )
+
     def calculate_daily_time(self, target_date: datetime) -> Tuple[float, float]:
         """
         Calculate total active and idle time for a specific day.
@@ -85,7 +230,7 @@ class ActivityWatchTracker:
         total_idle_seconds = 0
 
         # Look for AFK (Away From Keyboard) buckets to determine idle time
-        afk_buckets = [bid for bid in buckets if "afk" in bid.lower()]
+        afk_buckets = self.get_afk_buckets(buckets)
 
         if not afk_buckets:
             print(
@@ -104,15 +249,9 @@ class ActivityWatchTracker:
 
             print(f"  Found {len(events)} events")
 
-            for event in events:
-                duration = event.get("duration", 0)
-                data = event.get("data", {})
-                status = data.get("status", "unknown")
-
-                if status == "not-afk":
-                    total_active_seconds += duration
-                elif status == "afk":
-                    total_idle_seconds += duration
+            active_seconds, idle_seconds = self._sum_events(events)
+            total_active_seconds += active_seconds
+            total_idle_seconds += idle_seconds
 
         # Convert to hours
         active_hours = total_active_seconds / 3600
@@ -120,6 +259,79 @@ class ActivityWatchTracker:
 
         return active_hours, idle_hours
 
+    def _sum_events(self, events: List) -> Tuple[float, float]:
+        """
+        Sum the durations of AFK events by status.
+
+        Returns:
+            Tuple[float, float]: (active_seconds, idle_seconds)
+        """
+        active_seconds = 0
+        idle_seconds = 0
+
+        # AFK events have a stable schema, so subscript directly and only
+        # skip the rare malformed event. Local accumulators with if/elif are
+        # faster here than a status-keyed dict or two sum() passes.
+        for event in events:
+            try:
+                status = event["data"]["status"]
+                duration = event["duration"]
+            except KeyError:
+                continue
+
+            if status == "not-afk":
+                active_seconds += duration
+            elif status == "afk":
+                idle_seconds += duration
+
+        return active_seconds, idle_seconds
+
+    def _sum_events_by_day(
+        self, events: List, week_start: datetime, period_end: datetime
+    ) -> List[Tuple[float, float]]:
+        """
+        Sum the durations of a week's AFK events by day and status.
+
+        Events are clamped to [week_start, period_end) and split at midnight,
+        the same way aw-server clips raw events to each day for query_week
+        and calculate_daily_time.
+
+        Returns:
+            List[Tuple[float, float]]: (active_seconds, idle_seconds) for each
+            of the 7 days
+        """
+        active = [0.0] * 7
+        idle = [0.0] * 7
+
+        for event in events:
+            try:
+                status = event["data"]["status"]
+                duration = event["duration"]
+                # aw-server returns UTC timestamps; compare them naively, the
+                # same way the request ranges are sent
+                timestamp = event["timestamp"].replace("Z", "+00:00")
+                started = datetime.fromisoformat(timestamp).replace(tzinfo=None)
+            except (KeyError, ValueError):
+                continue
+            if status == "not-afk":
+                day_totals = active
+            elif status == "afk":
+                day_totals = idle
+            else:
+                continue
+
+            start = max(started, week_start)
+            end = min(started + timedelta(seconds=duration), period_end)
+            day_index = (start - week_start).days
+
+            while start < end:
+                day_end = min(week_start + timedelta(days=day_index + 1), end)
+                day_totals[day_index] += (day_end - start).total_seconds()
+                start = day_end
+                day_index += 1
+
+        return list(zip(active, idle))
+
     def get_week_range(self, target_date: datetime) -> Tuple[datetime, datetime]:
         """
         Get the start and end of the week containing the target date.
@@ -153,23 +365,67 @@ class ActivityWatchTracker:
             f"Analyzing weekly activity from {week_start.strftime('%Y-%m-%d')} to {(week_end - timedelta(days=1)).strftime('%Y-%m-%d')}"
         )
 
+        # Buckets don't change over the week, so fetch and filter them once
+        buckets = self.get_buckets()
+        afk_buckets = self.get_afk_buckets(buckets)
+        if not buckets:
+            print("No buckets found. Make sure ActivityWatch is running.")
+        elif not afk_buckets:
+            print(
+                "Warning: No AFK buckets found. Cannot determine idle time accurately."
+            )
+
+        dates = [week_start + timedelta(days=i) for i in range(7)]
+
+        # Days after today have no activity yet, so only ask for the days up
+        # to today and leave the rest at zero
+        today = datetime.now().date()
+        past_days = sum(1 for day in dates if day.date() <= today)
+        queried_end = week_start + timedelta(days=past_days)
+        queried_buckets = afk_buckets if past_days else []
+
+        # Let aw-server sum the whole week in one query per AFK bucket
+        bucket_totals = []
+        query_ok = True
+        for bucket_id in queried_buckets:
+            totals = self.query_week(week_start, bucket_id, past_days)
+            if len(totals) != past_days:
+                query_ok = False
+                break
+            bucket_totals.append(totals)
+
+        if not query_ok:
+            # Fall back to fetching each bucket's whole week in one request
+            # and splitting the events into days locally
+            bucket_totals = [
+                self._sum_events_by_day(
+                    self.fetch_week_events(bucket_id, week_start, queried_end),
+                    week_start,
+                    queried_end,
+                )
+                for bucket_id in queried_buckets
+            ]
+
+        daily_seconds = [[0.0, 0.0] for _ in dates]
+        for totals in bucket_totals:
+            for day_seconds, (active_seconds, idle_seconds) in zip(
+                daily_seconds, totals
+            ):
+                day_seconds[0] += active_seconds
+                day_seconds[1] += idle_seconds
+
+        results = [(active / 3600, idle / 3600) for active, idle in daily_seconds]
+
         total_active_hours = 0.0
         total_idle_hours = 0.0
         daily_breakdown = []
 
-        # Calculate time for each day of the week
-        current_date = week_start
-        while current_date < week_end:
-            active_hours, idle_hours = self.calculate_daily_time(current_date)
+        for current_date, (active_hours, idle_hours) in zip(dates, results):
             total_active_hours += active_hours
             total_idle_hours += idle_hours
 
-            day_name = current_date.strftime("%A")
-            daily_breakdown.append(
-                (f"{day_name} ({current_date.strftime('%Y-%m-%d')})", active_hours)
-            )
-
-            current_date += timedelta(days=1)
+            day_label = current_date.strftime("%A (%Y-%m-%d)")
+            daily_breakdown.append((day_label, active_hours))
 
         return total_active_hours, total_idle_hours, daily_breakdown
 
@@ -287,6 +543,7 @@ class ActivityWatchTracker:
         self, active_hours: float, idle_hours: float, target_date: datetime = None
     ):
         """Print a formatted summary of the time tracking results."""
+        lines: List[str] = []
         total_hours = active_hours + idle_hours
         target_hours = 8.0  # 8-hour workday target
 
@@ -295,34 +552,40 @@ class ActivityWatchTracker:
         is_holiday = self.is_holiday(analysis_date)
         holiday_name = self.get_holiday_info(analysis_date)
 
-        print("\n" + "=" * 50)
-        print("DAILY TIME SUMMARY")
-        print("=" * 50)
+        lines.append("\n" + "=" * 50)
+        lines.append("DAILY TIME SUMMARY")
+        lines.append("=" * 50)
 
         # Show holiday status
         if is_holiday:
-            print(f"🏖️  HOLIDAY: {holiday_name} ({analysis_date.strftime('%Y-%m-%d')})")
-            print("=" * 50)
+            lines.append(
+                f"🏖️  HOLIDAY: {holiday_name} ({analysis_date.strftime('%Y-%m-%d')})"
+            )
+            lines.append("=" * 50)
 
-        print(
-            f"Active Time:  {active_hours:.2f} hours ({active_hours * 60:.0f} minutes)"
+        active_minutes_total = active_hours * 60
+        idle_minutes_total = idle_hours * 60
+        lines.append(
+            f"Active Time:  {active_hours:.2f} hours ({active_minutes_total:.0f} minutes)"
+        )
+        lines.append(
+            f"Idle Time:    {idle_hours:.2f} hours ({idle_minutes_total:.0f} minutes)"
         )
-        print(f"Idle Time:    {idle_hours:.2f} hours ({idle_hours * 60:.0f} minutes)")
-        print(f"Total Time:   {total_hours:.2f} hours")
+        lines.append(f"Total Time:   {total_hours:.2f} hours")
 
         if total_hours > 0:
             active_percentage = (active_hours / total_hours) * 100
             idle_percentage = (idle_hours / total_hours) * 100
-            print(f"Active:       {active_percentage:.1f}%")
-            print(f"Idle:         {idle_percentage:.1f}%")
+            lines.append(f"Active:       {active_percentage:.1f}%")
+            lines.append(f"Idle:         {idle_percentage:.1f}%")
 
         # Calculate time left to reach 8-hour workday
-        print("-" * 50)
+        lines.append("-" * 50)
         if is_holiday:
-            print("HOLIDAY OVERTIME")
+            lines.append("HOLIDAY OVERTIME")
         else:
-            print("8-HOUR WORKDAY PROGRESS")
-        print("-" * 50)
+            lines.append("8-HOUR WORKDAY PROGRESS")
+        lines.append("-" * 50)
 
         if is_holiday:
             # On holidays, entire working time is considered overtime
@@ -330,19 +593,21 @@ class ActivityWatchTracker:
                 if active_hours >= 1.0:
                     active_hours_int = int(active_hours)
                     active_minutes = int((active_hours - active_hours_int) * 60)
-                    print(f"⚠️  Holiday Overtime: {active_hours_int}h {active_minutes}m")
+                    lines.append(
+                        f"⚠️  Holiday Overtime: {active_hours_int}h {active_minutes}m"
+                    )
                 else:
-                    active_minutes = int(active_hours * 60)
-                    print(f"⚠️  Holiday Overtime: {active_minutes} minutes")
+                    active_minutes = int(active_minutes_total)
+                    lines.append(f"⚠️  Holiday Overtime: {active_minutes} minutes")
 
                 # Show holiday overtime range
                 overtime_range = self.calculate_holiday_overtime_range(
                     active_hours, target_date
                 )
                 if overtime_range:
-                    print(f"Holiday work period: {overtime_range}")
+                    lines.append(f"Holiday work period: {overtime_range}")
             else:
-                print("🎉 No work on holiday - well deserved rest!")
+                lines.append("🎉 No work on holiday - well deserved rest!")
         else:
             # Regular workday logic
             if active_hours >= target_hours:
@@ -350,19 +615,21 @@ class ActivityWatchTracker:
                 if overtime_hours >= 1.0:
                     overtime_hours_int = int(overtime_hours)
                     overtime_minutes = int((overtime_hours - overtime_hours_int) * 60)
-                    print(
+                    lines.append(
                         f"✅ Target reached! Overtime: {overtime_hours_int}h {overtime_minutes}m"
                     )
                 else:
                     overtime_minutes = int(overtime_hours * 60)
-                    print(f"✅ Target reached! Overtime: {overtime_minutes} minutes")
+                    lines.append(
+                        f"✅ Target reached! Overtime: {overtime_minutes} minutes"
+                    )
 
                 # Show overtime range
                 overtime_range = self.calculate_overtime_range(
                     active_hours, target_hours, target_date
                 )
                 if overtime_range:
-                    print(f"Overtime period: {overtime_range}")
+                    lines.append(f"Overtime period: {overtime_range}")
             else:
                 remaining_hours = target_hours - active_hours
                 if remaining_hours >= 1.0:
@@ -370,25 +637,32 @@ class ActivityWatchTracker:
                     remaining_minutes = int(
                         (remaining_hours - remaining_hours_int) * 60
                     )
-                    print(f"⏳ Time left: {remaining_hours_int}h {remaining_minutes}m")
+                    lines.append(
+                        f"⏳ Time left: {remaining_hours_int}h {remaining_minutes}m"
+                    )
                 else:
                     remaining_minutes = int(remaining_hours * 60)
-                    print(f"⏳ Time left: {remaining_minutes} minutes")
+                    lines.append(f"⏳ Time left: {remaining_minutes} minutes")
 
         # Show progress percentage
         if is_holiday:
-            print(f"Holiday work: {active_hours:.2f} hours (all considered overtime)")
+            lines.append(
+                f"Holiday work: {active_hours:.2f} hours (all considered overtime)"
+            )
         else:
             progress_percentage = min((active_hours / target_hours) * 100, 100)
-            print(f"Progress:     {progress_percentage:.1f}% of 8-hour target")
+            lines.append(f"Progress:     {progress_percentage:.1f}% of 8-hour target")
 
             # Show estimated finish time (only for today and non-holidays)
             if target_date is None or target_date.date() == datetime.now().date():
                 if active_hours < target_hours:
                     finish_time = self.calculate_finish_time(active_hours, target_hours)
-                    print(f"Estimated finish time: {finish_time}")
+                    lines.append(f"Estimated finish time: {finish_time}")
+
+        lines.append("=" * 50)
 
-        print("=" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def print_weekly_summary(
         self,
@@ -398,98 +672,179 @@ class ActivityWatchTracker:
         week_start: datetime,
     ):
         """Print a formatted summary of the weekly time tracking results."""
+        lines: List[str] = []
         total_hours = total_active_hours + total_idle_hours
         target_weekly_hours = 40.0  # 40-hour work week target
 
-        print("\n" + "=" * 60)
-        print("WEEKLY TIME SUMMARY")
-        print("=" * 60)
-        print(
-            f"Week of {week_start.strftime('%Y-%m-%d')} to {(week_start + timedelta(days=6)).strftime('%Y-%m-%d')}"
-        )
-        print("-" * 60)
+        lines.append("\n" + "=" * 60)
+        lines.append("WEEKLY TIME SUMMARY")
+        lines.append("=" * 60)
+        week_start_str = week_start.strftime("%Y-%m-%d")
+        week_end_str = (week_start + timedelta(days=6)).strftime("%Y-%m-%d")
+        lines.append(f"Week of {week_start_str} to {week_end_str}")
+        lines.append("-" * 60)
 
         # Daily breakdown
         for day_info, hours in daily_breakdown:
-            print(f"{day_info:<30} {hours:>6.2f} hours")
+            lines.append(f"{day_info:<30} {hours:>6.2f} hours")
 
-        print("-" * 60)
-        print(
+        lines.append("-" * 60)
+        lines.append(
             f"Total Active Time:  {total_active_hours:.2f} hours ({total_active_hours * 60:.0f} minutes)"
         )
-        print(
+        lines.append(
             f"Total Idle Time:    {total_idle_hours:.2f} hours ({total_idle_hours * 60:.0f} minutes)"
         )
-        print(f"Total Time:         {total_hours:.2f} hours")
+        lines.append(f"Total Time:         {total_hours:.2f} hours")
 
         if total_hours > 0:
             active_percentage = (total_active_hours / total_hours) * 100
-            print(f"Active Percentage:  {active_percentage:.1f}%")
+            lines.append(f"Active Percentage:  {active_percentage:.1f}%")
 
         # Calculate weekly progress
-        print("-" * 60)
-        print("40-HOUR WORK WEEK PROGRESS")
-        print("-" * 60)
+        lines.append("-" * 60)
+        lines.append("40-HOUR WORK WEEK PROGRESS")
+        lines.append("-" * 60)
 
         if total_active_hours >= target_weekly_hours:
             overtime_hours = total_active_hours - target_weekly_hours
             if overtime_hours >= 1.0:
                 overtime_hours_int = int(overtime_hours)
                 overtime_minutes = int((overtime_hours - overtime_hours_int) * 60)
-                print(
+                lines.append(
                     f"✅ Weekly target reached! Overtime: {overtime_hours_int}h {overtime_minutes}m"
                 )
             else:
                 overtime_minutes = int(overtime_hours * 60)
-                print(f"✅ Weekly target reached! Overtime: {overtime_minutes} minutes")
+                lines.append(
+                    f"✅ Weekly target reached! Overtime: {overtime_minutes} minutes"
+                )
         else:
             remaining_hours = target_weekly_hours - total_active_hours
             if remaining_hours >= 1.0:
                 remaining_hours_int = int(remaining_hours)
                 remaining_minutes = int((remaining_hours - remaining_hours_int) * 60)
-                print(
+                lines.append(
                     f"⏳ Time left this week: {remaining_hours_int}h {remaining_minutes}m"
                 )
             else:
                 remaining_minutes = int(remaining_hours * 60)
-                print(f"⏳ Time left this week: {remaining_minutes} minutes")
+                lines.append(f"⏳ Time left this week: {remaining_minutes} minutes")
 
         # Show weekly progress percentage
         progress_percentage = min((total_active_hours / target_weekly_hours) * 100, 100)
-        print(f"Weekly Progress:    {progress_percentage:.1f}% of 40-hour target")
+        lines.append(
+            f"Weekly Progress:    {progress_percentage:.1f}% of 40-hour target"
+        )
 
         # Average daily hours
         avg_daily_hours = total_active_hours / 7
-        print(f"Average Daily:      {avg_daily_hours:.2f} hours")
+        lines.append(f"Average Daily:      {avg_daily_hours:.2f} hours")
+
+        lines.append("=" * 60)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+USAGE = (
+    "usage: activity-tracker [-h] [--date DATE] [--week] [--host HOST] " "[--port PORT]"
+)
+
+HELP = f"""{USAGE}
 
-        print("=" * 60)
+Track daily or weekly activity using ActivityWatch data
+
+options:
+  -h, --help   show this help message and exit
+  --date DATE  Date to analyze (YYYY-MM-DD format). Default is today.
+  --week       Analyze weekly data (Monday to Sunday). Use with --date to
+               specify week containing that date.
+  --host HOST  ActivityWatch host (default: localhost)
+  --port PORT  ActivityWatch port (default: 5600)"""
+
+
+def _usage_error(message: str):
+    """Print an argparse-style usage error and exit with status 2."""
+    sys.stderr.write(f"{USAGE}\nactivity-tracker: error: {message}\n")
+    sys.exit(2)
+
+
+OPTIONS = ("--help", "--date", "--week", "--host", "--port")
+
+
+def _resolve_option(name: str) -> str:
+    """
+    Expand an unambiguous prefix of a long option, as argparse does.
+
+    Returns:
+        str: The full option name, or name unchanged if nothing matches
+    """
+    if name in ("-h", "--") or name in OPTIONS or not name.startswith("--"):
+        return name
+
+    matches = [option for option in OPTIONS if option.startswith(name)]
+    if len(matches) > 1:
+        _usage_error(f"ambiguous option: {name} could match {', '.join(matches)}")
+    return matches[0] if matches else name
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command line arguments.
+
+    A small hand-rolled parser is used instead of argparse to keep startup
+    fast, since the tracker is often run from shell prompts and status bars.
+
+    Returns:
+        SimpleNamespace: date, week, host and port
+    """
+    args = SimpleNamespace(date=None, week=False, host="localhost", port=5600)
+    remaining = list(argv)
+
+    while remaining:
+        arg = remaining.pop(0)
+        if arg == "--":
+            # End of options; there are no positional arguments to take
+            if remaining:
+                _usage_error(f"unrecognized arguments: {' '.join(remaining)}")
+            break
+
+        name, sep, value = arg.partition("=")
+        name = _resolve_option(name)
+
+        if name in ("-h", "--help"):
+            if sep:
+                _usage_error(f"argument -h/--help: ignored explicit argument '{value}'")
+            print(HELP)
+            sys.exit(0)
+        elif name == "--week":
+            if sep:
+                _usage_error(f"argument --week: ignored explicit argument '{value}'")
+            args.week = True
+        elif name in ("--date", "--host", "--port"):
+            if not sep:
+                if not remaining or remaining[0].startswith("--"):
+                    _usage_error(f"argument {name}: expected one argument")
+                value = remaining.pop(0)
+
+            if name == "--date":
+                args.date = value
+            elif name == "--host":
+                args.host = value
+            else:
+                try:
+                    args.port = int(value)
+                except ValueError:
+                    _usage_error(f"argument --port: invalid int value: '{value}'")
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+
+    return args
 
 
 def main():
-    parser = argparse.ArgumentParser(
-        description="Track daily or weekly activity using ActivityWatch data"
-    )
-    parser.add_argument(
-        "--date",
-        type=str,
-        help="Date to analyze (YYYY-MM-DD format). Default is today.",
-    )
-    parser.add_argument(
-        "--week",
-        action="store_true",
-        help="Analyze weekly data (Monday to Sunday). Use with --date to specify week containing that date.",
-    )
-    parser.add_argument(
-        "--host",
-        type=str,
-        default="localhost",
-        help="ActivityWatch host (default: localhost)",
-    )
-    parser.add_argument(
-        "--port", type=int, default=5600, help="ActivityWatch port (default: 5600)"
-    )
-
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
 
     # Parse the target date
     if args.date:
@@ -502,33 +857,31 @@ def main():
         target_date = datetime.now()
 
     # Create tracker instance
-    tracker = ActivityWatchTracker(host=args.host, port=args.port)
+    with ActivityWatchTracker(host=args.host, port=args.port) as tracker:
+        # Test connection
+        try:
+            tracker.ping()
+            print(f"Successfully connected to ActivityWatch at {tracker.base_url}")
+        except requests.RequestException as e:
+            print(f"Error: Cannot connect to ActivityWatch at {tracker.base_url}")
+            print(f"Make sure ActivityWatch is running on {args.host}:{args.port}")
+            print(f"Connection error: {e}")
+            return
 
-    # Test connection
-    try:
-        response = requests.get(f"{tracker.base_url}/api/0/info")
-        response.raise_for_status()
-        print(f"Successfully connected to ActivityWatch at {tracker.base_url}")
-    except requests.RequestException as e:
-        print(f"Error: Cannot connect to ActivityWatch at {tracker.base_url}")
-        print(f"Make sure ActivityWatch is running on {args.host}:{args.port}")
-        print(f"Connection error: {e}")
-        return
-
-    # Calculate and display results
-    if args.week:
-        # Weekly analysis
-        total_active_hours, total_idle_hours, daily_breakdown = (
-            tracker.calculate_weekly_time(target_date)
-        )
-        week_start, _ = tracker.get_week_range(target_date)
-        tracker.print_weekly_summary(
-            total_active_hours, total_idle_hours, daily_breakdown, week_start
-        )
-    else:
-        # Daily analysis
-        active_hours, idle_hours = tracker.calculate_daily_time(target_date)
-        tracker.print_summary(active_hours, idle_hours, target_date)
+        # Calculate and display results
+        if args.week:
+            # Weekly analysis
+            total_active_hours, total_idle_hours, daily_breakdown = (
+                tracker.calculate_weekly_time(target_date)
+            )
+            week_start, _ = tracker.get_week_range(target_date)
+            tracker.print_weekly_summary(
+                total_active_hours, total_idle_hours, daily_breakdown, week_start
+            )
+        else:
+            # Daily analysis
+            active_hours, idle_hours = tracker.calculate_daily_time(target_date)
+            tracker.print_summary(active_hours, idle_hours, target_date)
 
 
 if __name__ == "__main__":